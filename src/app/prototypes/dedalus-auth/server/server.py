@@ -13,9 +13,67 @@ Server starts at http://127.0.0.1:8001/mcp (Streamable HTTP).
 """
 
 import os
+import time
 import asyncio
+import hashlib
 from dedalus_mcp import MCPServer, tool, get_context
 from dedalus_mcp.server import AuthorizationConfig, TransportSecuritySettings
+from dedalus_mcp.server.authorization import AuthorizationContext
+from dedalus_mcp.server.services.jwt_validator import JWTValidator, JWTValidatorConfig
+
+DEDALUS_AS_URL = os.getenv("DEDALUS_AS_URL", "https://as.dedaluslabs.ai")
+
+# How long (seconds) a validated token is trusted before re-verifying;
+# entries never outlive the token's own exp claim
+TOKEN_CACHE_TTL = float(os.getenv("DAUTH_TOKEN_CACHE_TTL", "300"))
+
+
+# ---------------------------------------------------------------------------
+# Token validation — JWT verification with a short-lived in-memory cache
+# ---------------------------------------------------------------------------
+
+class _CachingTokenValidator:
+    """Wrap a token validator and memoize successful validations.
+
+    Keyed by the SHA-256 of the token so raw tokens are never held in memory.
+    Failed validations are not cached, so a rejected token is re-checked on
+    every request.
+    """
+
+    def __init__(self, inner: JWTValidator, ttl: float) -> None:
+        self._inner = inner
+        self._ttl = ttl
+        self._cache: dict[bytes, tuple[float, AuthorizationContext]] = {}
+
+    async def validate(self, token: str) -> AuthorizationContext:
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+
+        hit = self._cache.get(key)
+        if hit is not None:
+            expires_at, context = hit
+            if now < expires_at:
+                return context
+            del self._cache[key]
+
+        context = await self._inner.validate(token)
+
+        expires_at = now + self._ttl
+        exp = context.claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        self._prune(now)
+        self._cache[key] = (expires_at, context)
+        return context
+
+    def invalidate(self, token: str) -> None:
+        """Drop a token from the cache (e.g. after a downstream 401)."""
+        self._cache.pop(hashlib.sha256(token.encode()).digest(), None)
+
+    def _prune(self, now: float) -> None:
+        expired = [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]
+        for k in expired:
+            del self._cache[k]
 
 
 # ---------------------------------------------------------------------------
@@ -76,17 +134,21 @@ def submit_homework(title: str, content: str) -> dict:
     }
 
 
+# Built once at import — the environment doesn't change while serving
+_SERVER_INFO = {
+    "server": "dauth-demo-mcp",
+    "version": "0.1.0",
+    "auth_enabled": True,
+    "required_scopes": ["read"],
+    "authorization_server": DEDALUS_AS_URL,
+    "tools": ["whoami", "get_secret_assignment", "submit_homework", "server_info"],
+}
+
+
 @tool(description="Check server health and auth configuration")
 def server_info() -> dict:
     """Public info about this server's auth setup."""
-    return {
-        "server": "dauth-demo-mcp",
-        "version": "0.1.0",
-        "auth_enabled": True,
-        "required_scopes": ["read"],
-        "authorization_server": os.getenv("DEDALUS_AS_URL", "https://as.dedaluslabs.ai"),
-        "tools": ["whoami", "get_secret_assignment", "submit_homework", "server_info"],
-    }
+    return _SERVER_INFO
 
 
 # ---------------------------------------------------------------------------
@@ -103,14 +165,24 @@ server = MCPServer(
         # Server-level scopes: every tool requires at least "read"
         required_scopes=["read"],
         # DAuth authorization server (managed OAuth 2.1)
-        authorization_servers=[
-            os.getenv("DEDALUS_AS_URL", "https://as.dedaluslabs.ai")
-        ],
+        authorization_servers=[DEDALUS_AS_URL],
     ),
     # Allow local dev without HTTPS
     http_security=TransportSecuritySettings(enable_dns_rebinding_protection=False),
 )
 
+# Verify tokens against the AS's JWKS, caching results so repeat calls
+# with the same token skip signature verification
+_as_url = DEDALUS_AS_URL.rstrip("/")
+token_validator = _CachingTokenValidator(
+    JWTValidator(JWTValidatorConfig(
+        jwks_uri=f"{_as_url}/.well-known/jwks.json",
+        issuer=_as_url,
+    )),
+    ttl=TOKEN_CACHE_TTL,
+)
+server.set_authorization_provider(token_validator)
+
 # Register all tools
 server.collect(whoami, get_secret_assignment, submit_homework, server_info)
 
@@ -119,5 +191,5 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", "8001"))
     print(f"Starting DAuth Demo MCP server at http://127.0.0.1:{port}/mcp")
     print("Authorization is ENABLED — unauthenticated requests will get 401")
-    print(f"DAuth AS: {os.getenv('DEDALUS_AS_URL', 'https://as.dedaluslabs.ai')}")
+    print(f"DAuth AS: {DEDALUS_AS_URL}")
     asyncio.run(server.serve(port=port))
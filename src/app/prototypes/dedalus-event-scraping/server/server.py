@@ -13,19 +13,32 @@ Run (from this directory):
 The server starts at http://127.0.0.1:8001/mcp (Streamable HTTP).
 """
 
+import os
 import re
 import json
 import asyncio
 import hashlib
+import threading
+from html import unescape
 from pathlib import Path
 
 import httpx
+import orjson
 from dedalus_mcp import MCPServer, tool
 from dedalus_mcp.server import TransportSecuritySettings
 
 # Path to the local events JSON file (lives next to the server)
 EVENTS_FILE = Path(__file__).parent / "events.json"
 
+# Parsed contents of EVENTS_FILE, reused until its mtime changes on disk,
+# plus an id -> list position index for O(1) single-event lookups
+_CACHE: dict = {"mtime": -1, "events": [], "index": {}}
+
+# Guards EVENTS_FILE and _CACHE: fetch_columbia_events appends from a worker
+# thread while the sync CRUD tools run on the event loop. Reentrant because
+# _append_events falls back to _read_events/_write_events.
+_EVENTS_LOCK = threading.RLock()
+
 COLUMBIA_EVENTS_URL = (
     "https://events.columbia.edu/feeder/main/eventsFeed.do"
     "?f=y&sort=dtstart.utc:asc"
@@ -35,77 +48,181 @@ COLUMBIA_EVENTS_URL = (
     "&skinName=list-json"
 )
 
+# Shared HTTP client — reuses pooled connections (and TLS sessions) across
+# tool calls instead of handshaking on every fetch. Closed in main().
+_HTTP_CLIENT = httpx.AsyncClient(
+    timeout=30,
+    http2=True,
+    headers={
+        "Accept-Encoding": "gzip, deflate, br",
+        "User-Agent": "columbia-events-mcp/0.1",
+    },
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_TAG_RE = re.compile(r"<[^>]*>")
+_SHORT_DATE_TRIM_RE = re.compile(r"/\d{2}$")
+
+
 def _strip_html(text: str) -> str:
-    """Remove HTML tags and decode common entities."""
-    text = re.sub(r"<[^>]*>", "", text)
-    text = text.replace("&lt;", "<").replace("&gt;", ">")
-    text = text.replace("&amp;", "&").replace("&#39;", "'").replace("&nbsp;", " ")
-    return text.strip()
+    """Remove HTML tags and decode HTML entities."""
+    return unescape(_TAG_RE.sub("", text)).strip()
 
 
 def _decode_entities(text: str) -> str:
-    """Decode common HTML entities in summaries."""
-    return text.replace("&amp;", "&").replace("&#39;", "'")
+    """Decode HTML entities in summaries."""
+    return unescape(text)
 
 
 def _clean_event(raw: dict) -> dict:
     """Transform a raw Bedework event into a clean, minimal format."""
-    start = raw.get("start", {})
-    end = raw.get("end", {})
-    location = raw.get("location", {})
+    # Runs once per fetched event — bind the hot lookups to locals
+    raw_get = raw.get
+    start_get = raw_get("start", {}).get
+    end_get = raw_get("end", {}).get
+    location_get = raw_get("location", {}).get
 
-    day_name = start.get("dayname", "")[:3]            # "Mon"
-    short_date = start.get("shortdate", "")            # "2/9/26"
-    date_part = re.sub(r"/\d{2}$", "", short_date)     # "2/9"
-    all_day = start.get("allday") == "true"
+    day_name = start_get("dayname", "")[:3]            # "Mon"
+    short_date = start_get("shortdate", "")            # "2/9/26"
+    date_part = _SHORT_DATE_TRIM_RE.sub("", short_date)  # "2/9"
+    all_day = start_get("allday") == "true"
 
-    time_range = "All day" if all_day else f"{start.get('time', '')} - {end.get('time', '')}"
+    time_range = "All day" if all_day else start_get("time", "") + " - " + end_get("time", "")
 
     # Stable ID from guid (or eventlink as fallback)
-    raw_id = raw.get("guid", raw.get("eventlink", ""))
-    stable_id = hashlib.md5(raw_id.encode()).hexdigest()[:12]
+    eventlink = raw_get("eventlink", "")
+    raw_id = raw_get("guid", eventlink)
+    stable_id = hashlib.blake2b(raw_id.encode(), digest_size=6).hexdigest()
 
     return {
         "id": stable_id,
-        "summary": _decode_entities(raw.get("summary", "")),
-        "link": raw.get("link", ""),
-        "eventlink": raw.get("eventlink", ""),
-        "startDate": raw.get("startDate", ""),
-        "endDate": raw.get("endDate", ""),
+        "summary": _decode_entities(raw_get("summary", "")),
+        "link": raw_get("link", ""),
+        "eventlink": eventlink,
+        "startDate": raw_get("startDate", ""),
+        "endDate": raw_get("endDate", ""),
         "location": {
-            "address": location.get("address", "").replace("\t", " "),
-            "mapLink": location.get("link", ""),
+            "address": location_get("address", "").replace("\t", " "),
+            "mapLink": location_get("link", ""),
         },
-        "description": _strip_html(raw.get("description", "")),
+        "description": _strip_html(raw_get("description", "")),
         "calendar": {
-            "shortLabel": f"{day_name} {date_part}",
+            "shortLabel": day_name + " " + date_part,
             "timeRange": time_range,
-            "timezone": start.get("timezone", ""),
+            "timezone": start_get("timezone", ""),
             "allDay": all_day,
         },
     }
 
 
+def _reindex() -> None:
+    """Rebuild the id -> position index from the cached events."""
+    _CACHE["index"] = {e.get("id"): i for i, e in enumerate(_CACHE["events"])}
+
+
 def _read_events() -> list[dict]:
-    """Read events from the local JSON file."""
-    if not EVENTS_FILE.exists():
-        return []
-    try:
-        data = json.loads(EVENTS_FILE.read_text())
-        return data if isinstance(data, list) else []
-    except (json.JSONDecodeError, Exception):
-        return []
+    """Read events from the local JSON file, reparsing only when it changes."""
+    with _EVENTS_LOCK:
+        if not EVENTS_FILE.exists():
+            _CACHE.update(mtime=-1, events=[], index={})
+            return _CACHE["events"]
+        mtime = EVENTS_FILE.stat().st_mtime_ns
+        if mtime != _CACHE["mtime"]:
+            try:
+                data = orjson.loads(EVENTS_FILE.read_bytes())
+            except (orjson.JSONDecodeError, json.JSONDecodeError, Exception):
+                data = []
+            _CACHE["events"] = data if isinstance(data, list) else []
+            _CACHE["mtime"] = mtime
+            _reindex()
+        return _CACHE["events"]
 
 
 def _write_events(events: list[dict]) -> None:
     """Write events to the local JSON file."""
-    EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    EVENTS_FILE.write_text(json.dumps(events, indent=2))
+    with _EVENTS_LOCK:
+        EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        EVENTS_FILE.write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
+        # Keep the cache in sync so our own writes don't force a reparse
+        _CACHE["events"] = events
+        _CACHE["mtime"] = EVENTS_FILE.stat().st_mtime_ns
+        _reindex()
+
+
+def _append_events(new_events: list[dict]) -> list[dict]:
+    """Append events to the local JSON file without rewriting what's there.
+
+    The new entries are spliced in before the array's closing bracket, so
+    the file stays a plain JSON array for other readers. Falls back to a
+    full rewrite when the file is missing, empty, or not shaped as expected.
+    Returns the full (cached) events list.
+    """
+    with _EVENTS_LOCK:
+        events = _read_events()
+        if not events:
+            _write_events(events + new_events)
+            return _CACHE["events"]
+
+        with EVENTS_FILE.open("r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            offset = max(0, size - 4096)
+            f.seek(offset)
+            tail = f.read().rstrip()
+            if not tail.endswith(b"]"):
+                _write_events(events + new_events)
+                return _CACHE["events"]
+
+            # Overwrite from just after the last element onwards
+            body_end = offset + len(tail[:-1].rstrip())
+            chunk = b"".join(
+                b",\n  " + orjson.dumps(e, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  ")
+                for e in new_events
+            )
+            f.seek(body_end)
+            f.write(chunk + b"\n]")
+            f.truncate()
+
+        for e in new_events:
+            _CACHE["index"][e.get("id")] = len(events)
+            events.append(e)
+        _CACHE["mtime"] = EVENTS_FILE.stat().st_mtime_ns
+        return events
+
+
+def _store_new_events(events: list[dict]) -> tuple[int, int]:
+    """Append the events whose id isn't stored yet.
+
+    The id check and the append happen under one hold of _EVENTS_LOCK, so
+    overlapping fetches can't both add the same event.
+    Returns (number added, total stored).
+    """
+    with _EVENTS_LOCK:
+        stored = _read_events()
+        known = set(_CACHE["index"])
+        new_events = []
+        for event in events:
+            if event["id"] not in known:
+                new_events.append(event)
+                known.add(event["id"])
+
+        # Nothing new on a repeat poll — leave the store untouched
+        if new_events:
+            stored = _append_events(new_events)
+        return len(new_events), len(stored)
+
+
+async def _fetch_feed(days: int, count: int) -> list[dict]:
+    """Fetch raw Bedework events for the next `days` days."""
+    url = f"{COLUMBIA_EVENTS_URL}&count={count}&days={days}"
+    resp = await _HTTP_CLIENT.get(url)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    return data.get("bwEventList", {}).get("events", [])
 
 
 # ---------------------------------------------------------------------------
@@ -120,34 +237,18 @@ def _write_events(events: list[dict]) -> None:
 ))
 async def fetch_columbia_events(days: int = 14, count: int = 50) -> dict:
     """Fetch, clean, and persist Columbia events."""
-    url = f"{COLUMBIA_EVENTS_URL}&count={count}&days={days}"
-
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        data = resp.json()
-
-    raw_events = data.get("bwEventList", {}).get("events", [])
-    clean_events = [_clean_event(e) for e in raw_events]
+    raw_events = await _fetch_feed(days, count)
+    clean_events = [_clean_event(raw) for raw in raw_events]
 
-    # Merge with existing events (upsert by id)
-    existing = _read_events()
-    existing_ids = {e["id"] for e in existing}
-
-    new_count = 0
-    for event in clean_events:
-        if event["id"] not in existing_ids:
-            existing.append(event)
-            existing_ids.add(event["id"])
-            new_count += 1
-
-    _write_events(existing)
+    # Merge with existing events (add by id). File I/O runs in a worker
+    # thread so the event loop keeps serving other requests meanwhile.
+    added, total = await asyncio.to_thread(_store_new_events, clean_events)
 
     return {
         "fetched": len(raw_events),
         "cleaned": len(clean_events),
-        "new_events_added": new_count,
-        "total_stored": len(existing),
+        "new_events_added": added,
+        "total_stored": total,
         "events": clean_events,
     }
 
@@ -161,23 +262,24 @@ def get_events() -> list[dict]:
 @tool(description="Get a single event by its ID from the local JSON file.")
 def get_event(event_id: str) -> dict:
     """Return a single event by ID, or an error if not found."""
-    for event in _read_events():
-        if event["id"] == event_id:
-            return event
-    return {"error": f"Event with id '{event_id}' not found"}
+    events = _read_events()
+    i = _CACHE["index"].get(event_id)
+    if i is None:
+        return {"error": f"Event with id '{event_id}' not found"}
+    return events[i]
 
 
 @tool(description="Delete an event by its ID from the local JSON file.")
 def delete_event(event_id: str) -> dict:
     """Remove an event by ID. Returns confirmation or error."""
-    events = _read_events()
-    original_count = len(events)
-    events = [e for e in events if e["id"] != event_id]
-
-    if len(events) == original_count:
-        return {"error": f"Event with id '{event_id}' not found"}
-
-    _write_events(events)
+    with _EVENTS_LOCK:
+        events = _read_events()
+        i = _CACHE["index"].get(event_id)
+        if i is None:
+            return {"error": f"Event with id '{event_id}' not found"}
+
+        events.pop(i)
+        _write_events(events)
     return {"deleted": event_id, "remaining": len(events)}
 
 
@@ -192,15 +294,17 @@ def update_event(event_id: str, updates_json: str) -> dict:
     except json.JSONDecodeError:
         return {"error": "updates_json must be valid JSON"}
 
-    events = _read_events()
-    for event in events:
-        if event["id"] == event_id:
-            updates.pop("id", None)  # never overwrite the id
-            event.update(updates)
-            _write_events(events)
-            return {"updated": event_id, "event": event}
+    with _EVENTS_LOCK:
+        events = _read_events()
+        i = _CACHE["index"].get(event_id)
+        if i is None:
+            return {"error": f"Event with id '{event_id}' not found"}
 
-    return {"error": f"Event with id '{event_id}' not found"}
+        event = events[i]
+        updates.pop("id", None)  # never overwrite the id
+        event.update(updates)
+        _write_events(events)
+    return {"updated": event_id, "event": event}
 
 
 @tool(description=(
@@ -221,13 +325,11 @@ def add_event(event_json: str) -> dict:
 
     # Generate ID if not provided
     if "id" not in event:
-        event["id"] = hashlib.md5(
-            f"{event['summary']}{event['startDate']}".encode()
-        ).hexdigest()[:12]
+        event["id"] = hashlib.blake2b(
+            f"{event['summary']}{event['startDate']}".encode(), digest_size=6
+        ).hexdigest()
 
-    events = _read_events()
-    events.append(event)
-    _write_events(events)
+    events = _append_events([event])
 
     return {"added": event["id"], "total": len(events), "event": event}
 
@@ -252,6 +354,13 @@ server.collect(
 )
 
 
+async def main() -> None:
+    try:
+        await server.serve(port=8001)
+    finally:
+        await _HTTP_CLIENT.aclose()
+
+
 if __name__ == "__main__":
     print("Starting Columbia Events MCP server at http://127.0.0.1:8001/mcp")
-    asyncio.run(server.serve(port=8001))
+    asyncio.run(main())
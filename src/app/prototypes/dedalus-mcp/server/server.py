@@ -25,22 +25,33 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # ---------------------------------------------------------------------------
-# Logging — verbose output so we can debug MCP integration issues
+# Logging — quiet by default; set MCP_LOG_LEVEL=DEBUG and MCP_DEBUG=1 for
+# verbose output when debugging MCP integration issues
 # ---------------------------------------------------------------------------
+LOG_LEVEL = os.getenv("MCP_LOG_LEVEL", "WARNING").upper()
+
 logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    level=LOG_LEVEL,
+    format=(
+        "%(message)s"
+        if os.getenv("MCP_LOG_MINIMAL")
+        else "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    ),
     stream=sys.stdout,
 )
 logger = logging.getLogger("mcp-server")
+# Set explicitly — dedalus_mcp resets the root logger to INFO when it
+# installs its own handler, which would otherwise override LOG_LEVEL
+logger.setLevel(LOG_LEVEL)
 
 # Also crank up dedalus_mcp internals
-logging.getLogger("dedalus_mcp").setLevel(logging.DEBUG)
-logging.getLogger("uvicorn").setLevel(logging.DEBUG)
-logging.getLogger("uvicorn.access").setLevel(logging.DEBUG)
-logging.getLogger("uvicorn.error").setLevel(logging.DEBUG)
-logging.getLogger("starlette").setLevel(logging.DEBUG)
-logging.getLogger("httpx").setLevel(logging.DEBUG)
+if os.getenv("MCP_DEBUG"):
+    logging.getLogger("dedalus_mcp").setLevel(logging.DEBUG)
+    logging.getLogger("uvicorn").setLevel(logging.DEBUG)
+    logging.getLogger("uvicorn.access").setLevel(logging.DEBUG)
+    logging.getLogger("uvicorn.error").setLevel(logging.DEBUG)
+    logging.getLogger("starlette").setLevel(logging.DEBUG)
+    logging.getLogger("httpx").setLevel(logging.DEBUG)
 
 # ---------------------------------------------------------------------------
 # Tools — these are the functions the LLM can call
@@ -49,33 +60,36 @@ logging.getLogger("httpx").setLevel(logging.DEBUG)
 @tool(description="Say hello to someone by name")
 def hello(name: str) -> str:
     """Greet a person by name."""
-    logger.info(f"[TOOL CALL] hello(name={name!r})")
+    logger.info("[TOOL CALL] hello(name=%r)", name)
     result = f"Hello, {name}! Welcome to the Dedalus MCP prototype."
-    logger.info(f"[TOOL RESULT] hello -> {result!r}")
+    logger.info("[TOOL RESULT] hello -> %r", result)
     return result
 
 
 @tool(description="Add two numbers together")
 def add(a: int, b: int) -> int:
     """Add two integers and return the sum."""
-    logger.info(f"[TOOL CALL] add(a={a}, b={b})")
+    logger.info("[TOOL CALL] add(a=%s, b=%s)", a, b)
     result = a + b
-    logger.info(f"[TOOL RESULT] add -> {result}")
+    logger.info("[TOOL RESULT] add -> %s", result)
     return result
 
 
+# Static, so built once at import rather than on every call
+_SERVER_STATUS = {
+    "status": "running",
+    "version": "0.1.0",
+    "server": "hello-world-mcp",
+    "tools_registered": 4,
+}
+
+
 @tool(description="Get the current server status and uptime info")
 def server_status() -> dict:
     """Return dummy server status information."""
     logger.info("[TOOL CALL] server_status()")
-    result = {
-        "status": "running",
-        "version": "0.1.0",
-        "server": "hello-world-mcp",
-        "tools_registered": 4,
-    }
-    logger.info(f"[TOOL RESULT] server_status -> {result}")
-    return result
+    logger.debug("[TOOL RESULT] server_status -> %s", _SERVER_STATUS)
+    return _SERVER_STATUS
 
 
 @tool(description="Get current user's auth context (demonstrates DAuth)")
@@ -84,11 +98,11 @@ def whoami() -> dict:
     logger.info("[TOOL CALL] whoami()")
     try:
         ctx = get_context()
-        logger.debug(f"  got context: {ctx}")
+        logger.debug("  got context: %s", ctx)
         auth = ctx.auth_context
-        logger.debug(f"  auth_context: {auth}")
+        logger.debug("  auth_context: %s", auth)
     except Exception as e:
-        logger.error(f"  get_context() failed: {e}", exc_info=True)
+        logger.error("  get_context() failed: %s", e, exc_info=True)
         return {"user": "anonymous", "authenticated": False, "error": str(e)}
 
     if auth is None:
@@ -101,7 +115,7 @@ def whoami() -> dict:
         "scopes": auth.scopes,
         "claims": auth.claims,
     }
-    logger.info(f"[TOOL RESULT] whoami -> {result}")
+    logger.debug("[TOOL RESULT] whoami -> %s", result)
     return result
 
 
@@ -116,7 +130,7 @@ server = MCPServer(
     # Stateless mode — no session tracking needed for local dev
     streamable_http_stateless=True,
 )
-logger.info(f"MCPServer created: name={server.name!r} (no DAuth, stateless, no DNS rebinding protection)")
+logger.info("MCPServer created: name=%r (no DAuth, stateless, no DNS rebinding protection)", server.name)
 
 # Register all tools
 server.collect(hello, add, server_status, whoami)
@@ -126,10 +140,10 @@ logger.info("Registered tools: hello, add, server_status, whoami")
 if __name__ == "__main__":
     port = int(os.getenv("MCP_PORT", "8000"))
     logger.info("=" * 60)
-    logger.info(f"Starting MCP server at http://127.0.0.1:{port}/mcp")
-    logger.info(f"  Server name: {server.name}")
-    logger.info(f"  Auth: none (local dev)")
-    logger.info(f"  Tools: hello, add, server_status, whoami")
-    logger.info(f"  PID: {os.getpid()}")
+    logger.info("Starting MCP server at http://127.0.0.1:%s/mcp", port)
+    logger.info("  Server name: %s", server.name)
+    logger.info("  Auth: none (local dev)")
+    logger.info("  Tools: hello, add, server_status, whoami")
+    logger.info("  PID: %s", os.getpid())
     logger.info("=" * 60)
     asyncio.run(server.serve(port=port))
@@ -13,13 +13,18 @@ The server starts at http://127.0.0.1:8002/mcp (Streamable HTTP).
 import os
 import re
 import sys
-import json
+import time
 import logging
 import asyncio
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 from dedalus_mcp import MCPServer, tool
 from dedalus_mcp.server import TransportSecuritySettings
 from dotenv import load_dotenv
@@ -47,6 +52,10 @@ logging.getLogger("httpx").setLevel(logging.DEBUG)
 CANVAS_BASE_URL = os.getenv("CANVAS_BASE_URL", "https://courseworks2.columbia.edu")
 CANVAS_API_TOKEN = os.getenv("CANVAS_API_TOKEN", "")
 CACHE_FILE = Path(__file__).parent / "canvas_cache.json"
+# Max Canvas requests in flight at once, shared by pagination and fan-out
+CANVAS_MAX_CONCURRENCY = int(os.getenv("CANVAS_MAX_CONCURRENCY", "64"))
+# Seconds an identical Canvas GET is answered from memory without a request
+CANVAS_RESPONSE_TTL = float(os.getenv("CANVAS_RESPONSE_TTL", "60"))
 
 if not CANVAS_API_TOKEN:
     logger.warning("CANVAS_API_TOKEN is not set! API calls will fail.")
@@ -56,67 +65,228 @@ if not CANVAS_API_TOKEN:
 # Canvas API helpers
 # ---------------------------------------------------------------------------
 
-def _headers() -> dict:
-    return {"Authorization": f"Bearer {CANVAS_API_TOKEN}"}
+_HEADERS = {"Authorization": f"Bearer {CANVAS_API_TOKEN}"}
 
 
-def _get(endpoint: str, params: dict | None = None) -> dict | list:
+# Shared client — keeps connections (and TLS sessions) to Canvas alive
+# across tool calls instead of handshaking per request, and multiplexes
+# concurrent requests over HTTP/2 when Canvas offers it. Closed in main().
+_CLIENT = httpx.AsyncClient(
+    base_url=f"{CANVAS_BASE_URL}/api/v1",
+    headers=_HEADERS,
+    http2=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=30.0,
+)
+
+
+# Client-side pacing so bursts of tool calls don't trip Canvas's 429s,
+# plus a cap on concurrent requests so fan-out can't exhaust sockets
+_LIMITER = AsyncLimiter(max_rate=10, time_period=1)
+_SEM = asyncio.Semaphore(CANVAS_MAX_CONCURRENCY)
+
+# Canvas reports its remaining request budget in x-rate-limit-remaining;
+# below this we slow down before Canvas starts throttling us
+RATE_LIMIT_LOW_WATER = 100.0
+
+# Bodies (and syllabus/page HTML) larger than this are decoded on a worker
+# thread so one big payload doesn't stall every other tool call
+OFFLOAD_BYTES = 32768
+
+# Last ETag, body and pagination links per request URL, so re-polls of
+# unchanged data come back as a bodiless 304 instead of a full download.
+# Submissions and todo items change too often to be worth caching. Bounded
+# like _MEMO, oldest entry evicted first.
+_ETAGS: dict[str, tuple[str, bytes, dict[str, str]]] = {}
+_ETAGS_MAX = 256
+_NO_CACHE = ("/submissions/", "/todo")
+
+# Decoded responses per request URL for CANVAS_RESPONSE_TTL seconds, so a
+# repeated tool call within a conversation skips the network entirely
+_MEMO: dict[str, tuple[float, dict | list, dict[str, str]]] = {}
+_MEMO_MAX = 256
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry throttled (429) and server-side (5xx) failures only."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    status = exc.response.status_code
+    return status == 429 or status >= 500
+
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+async def _request(
+    url: str, params: dict | None = None, headers: dict | None = None
+) -> httpx.Response:
+    """Rate-limited GET against Canvas; raises for error statuses."""
+    async with _SEM, _LIMITER:
+        response = await _CLIENT.get(url, params=params, headers=headers)
+    logger.debug(f"  {response.http_version} {response.status_code} {response.url}")
+
+    remaining = response.headers.get("x-rate-limit-remaining")
+    try:
+        low = remaining is not None and float(remaining) < RATE_LIMIT_LOW_WATER
+    except ValueError:
+        low = False
+    if low:
+        logger.debug(f"  Canvas rate budget low ({remaining}), backing off")
+        await asyncio.sleep(0.5)
+
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+async def _loads(body: bytes) -> dict | list:
+    """orjson.loads, moved off the event loop for large bodies."""
+    if len(body) > OFFLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, body)
+    return orjson.loads(body)
+
+
+async def _fetch(url: str, params: dict | None = None) -> tuple[dict | list, dict[str, str]]:
+    """GET url and decode it, served from _MEMO or revalidated with ETag when possible.
+
+    Returns the decoded JSON body and the response's rel -> URL links.
+    """
+    # Same merge httpx.Request does; URL(url, params=...) would drop url's query
+    key = str(httpx.URL(url).copy_merge_params(params or {}))
+    cacheable = not any(part in key for part in _NO_CACHE)
+    if cacheable:
+        memo = _MEMO.get(key)
+        if memo and memo[0] > time.monotonic():
+            logger.debug(f"  memo hit {key}")
+            return memo[1], memo[2]
+    cached = _ETAGS.get(key) if cacheable else None
+
+    response = await _request(url, params, {"If-None-Match": cached[0]} if cached else None)
+    if response.status_code == 304 and cached:
+        logger.debug(f"  304 Not Modified {key}")
+        data, links = await _loads(cached[1]), cached[2]
+    else:
+        # httpx parses the Link header (RFC 8288), including quoted commas
+        links = {rel: link["url"] for rel, link in response.links.items()}
+        data = await _loads(response.content)
+        etag = response.headers.get("etag")
+        if cacheable and etag:
+            _ETAGS.pop(key, None)
+            if len(_ETAGS) >= _ETAGS_MAX:
+                _ETAGS.pop(next(iter(_ETAGS)))
+            _ETAGS[key] = (etag, response.content, links)
+
+    if cacheable:
+        _MEMO.pop(key, None)
+        if len(_MEMO) >= _MEMO_MAX:
+            _MEMO.pop(next(iter(_MEMO)))
+        _MEMO[key] = (time.monotonic() + CANVAS_RESPONSE_TTL, data, links)
+    return data, links
+
+
+async def _get(endpoint: str, params: dict | None = None) -> dict | list:
     """Make an authenticated GET request to Canvas API."""
-    url = f"{CANVAS_BASE_URL}/api/v1{endpoint}"
-    logger.debug(f"  GET {url} params={params}")
-    response = httpx.get(url, headers=_headers(), params=params or {}, timeout=30.0)
-    response.raise_for_status()
-    return response.json()
+    logger.debug(f"  GET {endpoint} params={params}")
+    data, _ = await _fetch(endpoint, params)
+    return data
 
 
-def _get_paginated(endpoint: str, params: dict | None = None, max_pages: int = 5) -> list:
-    """Handle Canvas Link-header pagination, collecting up to max_pages of results."""
-    url = f"{CANVAS_BASE_URL}/api/v1{endpoint}"
-    all_results = []
+def _page_number(url: str | None) -> int | None:
+    """Numeric page= value of a Canvas page URL (None for bookmark cursors)."""
+    if not url:
+        return None
+    page = parse_qs(urlsplit(url).query).get("page", [""])[0]
+    return int(page) if page.isdigit() else None
+
+
+def _with_page(url: str, page: int) -> str:
+    """Return url with its page= query param set to page."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+async def _get_paginated(endpoint: str, params: dict | None = None, max_pages: int = 5) -> list:
+    """Handle Canvas Link-header pagination, collecting up to max_pages of results.
+
+    When Canvas reports a numeric rel="last" page, the remaining pages are
+    fetched concurrently; otherwise rel="next" links are followed in order.
+    """
     params = dict(params or {})
     params["per_page"] = 100
 
-    for _ in range(max_pages):
-        logger.debug(f"  GET (paginated) {url} params={params}")
-        response = httpx.get(url, headers=_headers(), params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
+    logger.debug(f"  GET (paginated) {endpoint} params={params}")
+    data, links = await _fetch(endpoint, params)
+    pages = [data]
+
+    last_page = _page_number(links.get("last"))
+    if last_page is not None:
+        urls = [_with_page(links["last"], p) for p in range(2, min(last_page, max_pages) + 1)]
+        logger.debug(f"  GET (paginated) {len(urls)} more pages of {endpoint} concurrently")
+        for data, _ in await asyncio.gather(*(_fetch(u) for u in urls)):
+            pages.append(data)
+    else:
+        next_url = links.get("next")
+        while next_url and len(pages) < max_pages:
+            # params are baked into the URL now; passing {} would make httpx
+            # drop the URL's query string
+            logger.debug(f"  GET (paginated) {next_url}")
+            data, links = await _fetch(next_url)
+            pages.append(data)
+            next_url = links.get("next")
+
+    all_results = []
+    for data in pages:
         if isinstance(data, list):
             all_results.extend(data)
         else:
             all_results.append(data)
+    return all_results
 
-        # Check for next page via Link header
-        links = response.headers.get("Link", "")
-        next_url = None
-        for link in links.split(","):
-            if 'rel="next"' in link:
-                next_url = link.split(";")[0].strip().strip("<>")
-                break
-        if not next_url:
-            break
-        url = next_url
-        params = {}  # params are baked into the URL now
 
-    return all_results
+def _read_json(path: Path, default):
+    """Parse a JSON file, returning default if it is missing or unreadable."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
+        return default
+
+
+def _write_json(path: Path, obj) -> None:
+    """Serialize obj to path as indented JSON.
+
+    Writes a sibling temp file and swaps it in with os.replace, so a crash
+    mid-write can't leave a truncated file behind.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp, path)
+
+
+# Parsed contents of CACHE_FILE, loaded on first use and kept in memory so
+# each update only serializes instead of re-reading and re-parsing the file
+_CACHE: dict | None = None
+
+
+def _load_cache() -> dict:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = _read_json(CACHE_FILE, {})
+    return _CACHE
 
 
 def _update_cache(key: str, data: any) -> None:
     """Update a key in the local cache file."""
-    cache = {}
-    if CACHE_FILE.exists():
-        try:
-            cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
-            cache = {}
-
+    cache = _load_cache()
     cache[key] = data
     cache["lastUpdated"] = datetime.now().isoformat()
 
-    CACHE_FILE.write_text(
-        json.dumps(cache, indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
-    )
+    _write_json(CACHE_FILE, cache)
     logger.info(f"  Cache updated: {key} ({len(data) if isinstance(data, list) else 'obj'} items)")
 
 
@@ -125,11 +295,11 @@ def _update_cache(key: str, data: any) -> None:
 # ---------------------------------------------------------------------------
 
 @tool(description="List all active courses for the current Canvas user. Returns course id, name, code, term, and grade info.")
-def list_courses(enrollment_state: str = "active") -> list[dict]:
+async def list_courses(enrollment_state: str = "active") -> list[dict]:
     """List the current user's courses."""
     logger.info(f"[TOOL CALL] list_courses(enrollment_state={enrollment_state!r})")
 
-    courses = _get_paginated("/courses", {
+    courses = await _get_paginated("/courses", {
         "enrollment_state": enrollment_state,
         "include[]": ["term", "total_scores", "favorites"],
     })
@@ -140,21 +310,21 @@ def list_courses(enrollment_state: str = "active") -> list[dict]:
 
 
 @tool(description="Get details for a specific course by its Canvas course ID. Includes term, grades, and syllabus.")
-def get_course(course_id: int) -> dict:
+async def get_course(course_id: int) -> dict:
     """Get details for a specific course."""
     logger.info(f"[TOOL CALL] get_course(course_id={course_id})")
 
-    return _get(f"/courses/{course_id}", {
+    return await _get(f"/courses/{course_id}", {
         "include[]": ["term", "total_scores", "syllabus_body"],
     })
 
 
 @tool(description="List assignments for a Canvas course, sorted by due date. Includes submission status and score statistics.")
-def list_assignments(course_id: int, order_by: str = "due_at") -> list[dict]:
+async def list_assignments(course_id: int, order_by: str = "due_at") -> list[dict]:
     """List assignments for a course, sorted by due date."""
     logger.info(f"[TOOL CALL] list_assignments(course_id={course_id}, order_by={order_by!r})")
 
-    assignments = _get_paginated(f"/courses/{course_id}/assignments", {
+    assignments = await _get_paginated(f"/courses/{course_id}/assignments", {
         "order_by": order_by,
         "include[]": ["submission", "score_statistics"],
     })
@@ -165,75 +335,75 @@ def list_assignments(course_id: int, order_by: str = "due_at") -> list[dict]:
 
 
 @tool(description="Get details for a specific assignment including description, rubric, and submission info.")
-def get_assignment(course_id: int, assignment_id: int) -> dict:
+async def get_assignment(course_id: int, assignment_id: int) -> dict:
     """Get details for a specific assignment."""
     logger.info(f"[TOOL CALL] get_assignment(course_id={course_id}, assignment_id={assignment_id})")
 
-    return _get(f"/courses/{course_id}/assignments/{assignment_id}", {
+    return await _get(f"/courses/{course_id}/assignments/{assignment_id}", {
         "include[]": ["submission", "score_statistics"],
     })
 
 
 @tool(description="Get the current user's submission for a specific assignment. Shows score, grade, comments, and rubric assessment.")
-def get_my_submission(course_id: int, assignment_id: int) -> dict:
+async def get_my_submission(course_id: int, assignment_id: int) -> dict:
     """Get the current user's submission for a specific assignment."""
     logger.info(f"[TOOL CALL] get_my_submission(course_id={course_id}, assignment_id={assignment_id})")
 
-    return _get(
+    return await _get(
         f"/courses/{course_id}/assignments/{assignment_id}/submissions/self",
         {"include[]": ["submission_comments", "rubric_assessment"]},
     )
 
 
 @tool(description="Get the current user's upcoming calendar events and assignment due dates.")
-def get_upcoming_events() -> list[dict]:
+async def get_upcoming_events() -> list[dict]:
     """Get the current user's upcoming events."""
     logger.info("[TOOL CALL] get_upcoming_events()")
 
-    return _get("/users/self/upcoming_events")
+    return await _get("/users/self/upcoming_events")
 
 
 @tool(description="Get the current user's todo items — assignments that need submitting or grading.")
-def get_todo_items() -> list[dict]:
+async def get_todo_items() -> list[dict]:
     """Get todo items for the current user."""
     logger.info("[TOOL CALL] get_todo_items()")
 
-    todos = _get("/users/self/todo")
+    todos = await _get("/users/self/todo")
     _update_cache("todos", todos)
     return todos
 
 
 @tool(description="Get the grade breakdown for all assignments in a course for the current user.")
-def get_grades_summary(course_id: int) -> list[dict]:
+async def get_grades_summary(course_id: int) -> list[dict]:
     """Get grade breakdown per assignment for the current user."""
     logger.info(f"[TOOL CALL] get_grades_summary(course_id={course_id})")
 
-    return _get(f"/courses/{course_id}/analytics/users/self/assignments")
+    return await _get(f"/courses/{course_id}/analytics/users/self/assignments")
 
 
 @tool(description="Get recent announcements for the given courses. Pass a list of course IDs and optionally a start_date (YYYY-MM-DD).")
-def list_announcements(course_ids: list[int], start_date: str = "") -> list[dict]:
+async def list_announcements(course_ids: list[int], start_date: str = "") -> list[dict]:
     """Get recent announcements for the given courses."""
     logger.info(f"[TOOL CALL] list_announcements(course_ids={course_ids}, start_date={start_date!r})")
 
     params: dict = {"context_codes[]": [f"course_{cid}" for cid in course_ids]}
     if start_date:
         params["start_date"] = start_date
-    return _get("/announcements", params)
+    return await _get("/announcements", params)
 
 
 @tool(description="List all modules for a course, including module items.")
-def list_modules(course_id: int) -> list[dict]:
+async def list_modules(course_id: int) -> list[dict]:
     """List all modules for a course."""
     logger.info(f"[TOOL CALL] list_modules(course_id={course_id})")
 
-    return _get_paginated(f"/courses/{course_id}/modules", {
+    return await _get_paginated(f"/courses/{course_id}/modules", {
         "include[]": ["items"],
     })
 
 
 @tool(description="List calendar events in a date range. Specify start_date and end_date (YYYY-MM-DD), optionally filter by course IDs and event type ('event' or 'assignment').")
-def list_calendar_events(
+async def list_calendar_events(
     start_date: str,
     end_date: str,
     course_ids: list[int] = [],
@@ -249,52 +419,58 @@ def list_calendar_events(
     }
     if course_ids:
         params["context_codes[]"] = [f"course_{cid}" for cid in course_ids]
-    return _get_paginated("/calendar_events", params)
+    return await _get_paginated("/calendar_events", params)
 
 
 @tool(description="Get the current user's Canvas profile.")
-def get_user_profile() -> dict:
+async def get_user_profile() -> dict:
     """Get the current user's profile."""
     logger.info("[TOOL CALL] get_user_profile()")
 
-    return _get("/users/self/profile")
+    return await _get("/users/self/profile")
 
 
 # ---------------------------------------------------------------------------
 # Syllabus & Content Tools
 # ---------------------------------------------------------------------------
 
+_RE_BR = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_RE_BLOCK = re.compile(r"</(p|div|h[1-6]|li|tr)>", re.IGNORECASE)
+_RE_BLANK = re.compile(r"\n{3,}")
+
+
 def _strip_html(html: str) -> str:
-    """Strip HTML tags and decode common entities. Returns plain text."""
+    """Strip HTML tags and decode entities. Returns plain text."""
     if not html:
         return ""
-    text = re.sub(r"<br\s*/?>", "\n", html, flags=re.IGNORECASE)
-    text = re.sub(r"</(p|div|h[1-6]|li|tr)>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "", text)
-    text = (
-        text.replace("&amp;", "&")
-        .replace("&#39;", "'")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&nbsp;", " ")
-        .replace("&quot;", '"')
-    )
+    # Line breaks at <br> and block ends; the parser then drops the
+    # remaining tags and decodes every entity in one C-level pass
+    text = _RE_BR.sub("\n", html)
+    text = _RE_BLOCK.sub("\n", text)
+    text = LexborHTMLParser(text).text(separator="")
     # Collapse multiple blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_BLANK.sub("\n\n", text)
     return text.strip()
 
 
+async def _strip_html_async(html: str) -> str:
+    """_strip_html, moved off the event loop for large documents."""
+    if len(html) > OFFLOAD_BYTES:
+        return await asyncio.to_thread(_strip_html, html)
+    return _strip_html(html)
+
+
 @tool(description="Get the syllabus for a course. Returns the syllabus body as plain text (HTML stripped). This is the syllabus content set by the instructor in Canvas. Look for office hours, exam dates, grading policies, etc.")
-def get_syllabus(course_id: int) -> dict:
+async def get_syllabus(course_id: int) -> dict:
     """Fetch the syllabus_body for a course and return it as cleaned text."""
     logger.info(f"[TOOL CALL] get_syllabus(course_id={course_id})")
 
-    course = _get(f"/courses/{course_id}", {
+    course = await _get(f"/courses/{course_id}", {
         "include[]": ["syllabus_body"],
     })
 
     raw_html = course.get("syllabus_body") or ""
-    plain_text = _strip_html(raw_html)
+    plain_text = await _strip_html_async(raw_html)
 
     result = {
         "course_id": course_id,
@@ -308,7 +484,7 @@ def get_syllabus(course_id: int) -> dict:
 
 
 @tool(description="List all wiki pages for a course. Syllabi, office hours, and exam schedules are often published as Canvas pages. Returns page titles and URLs.")
-def list_course_pages(course_id: int, search_term: str = "") -> list[dict]:
+async def list_course_pages(course_id: int, search_term: str = "") -> list[dict]:
     """List wiki pages in a course, optionally filtering by search term."""
     logger.info(f"[TOOL CALL] list_course_pages(course_id={course_id}, search_term={search_term!r})")
 
@@ -316,7 +492,7 @@ def list_course_pages(course_id: int, search_term: str = "") -> list[dict]:
     if search_term:
         params["search_term"] = search_term
 
-    pages = _get_paginated(f"/courses/{course_id}/pages", params)
+    pages = await _get_paginated(f"/courses/{course_id}/pages", params)
     logger.info(f"  Found {len(pages)} pages")
 
     return [
@@ -333,14 +509,14 @@ def list_course_pages(course_id: int, search_term: str = "") -> list[dict]:
 
 
 @tool(description="Get the full content of a Canvas wiki page by its URL slug. Use this after list_course_pages to read a specific page. Returns the page body as plain text. Great for reading syllabus pages, office hours pages, exam info pages, etc.")
-def get_course_page(course_id: int, page_url: str) -> dict:
+async def get_course_page(course_id: int, page_url: str) -> dict:
     """Fetch a specific wiki page and return its body as plain text."""
     logger.info(f"[TOOL CALL] get_course_page(course_id={course_id}, page_url={page_url!r})")
 
-    page = _get(f"/courses/{course_id}/pages/{page_url}")
+    page = await _get(f"/courses/{course_id}/pages/{page_url}")
 
     raw_html = page.get("body") or ""
-    plain_text = _strip_html(raw_html)
+    plain_text = await _strip_html_async(raw_html)
 
     return {
         "course_id": course_id,
@@ -352,11 +528,11 @@ def get_course_page(course_id: int, page_url: str) -> dict:
 
 
 @tool(description="Search for files in a course by name. Use this to find syllabus PDFs, exam schedules, or other uploaded documents. Returns file names, sizes, and download URLs.")
-def search_course_files(course_id: int, search_term: str = "syllabus") -> list[dict]:
+async def search_course_files(course_id: int, search_term: str = "syllabus") -> list[dict]:
     """Search for files in a course, defaulting to 'syllabus'."""
     logger.info(f"[TOOL CALL] search_course_files(course_id={course_id}, search_term={search_term!r})")
 
-    files = _get_paginated(f"/courses/{course_id}/files", {
+    files = await _get_paginated(f"/courses/{course_id}/files", {
         "search_term": search_term,
     })
     logger.info(f"  Found {len(files)} files matching '{search_term}'")
@@ -408,6 +584,13 @@ server.collect(
 logger.info("Registered 16 Canvas LMS tools")
 
 
+async def main(port: int) -> None:
+    try:
+        await server.serve(port=port)
+    finally:
+        await _CLIENT.aclose()
+
+
 if __name__ == "__main__":
     port = int(os.getenv("MCP_PORT", "8002"))
     logger.info("=" * 60)
@@ -418,4 +601,4 @@ if __name__ == "__main__":
     logger.info(f"  Cache file: {CACHE_FILE}")
     logger.info(f"  PID: {os.getpid()}")
     logger.info("=" * 60)
-    asyncio.run(server.serve(port=port))
+    asyncio.run(main(port))
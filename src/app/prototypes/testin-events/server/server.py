@@ -12,14 +12,17 @@ The server starts at http://127.0.0.1:8001/mcp (Streamable HTTP).
 
 import os
 import sys
-import json
+import html
 import re
 import logging
+import itertools
 import asyncio
 from pathlib import Path
 from datetime import datetime
 
 import httpx
+import ijson
+import orjson
 from dedalus_mcp import MCPServer, tool
 from dedalus_mcp.server import TransportSecuritySettings
 from dotenv import load_dotenv
@@ -45,6 +48,8 @@ logging.getLogger("httpx").setLevel(logging.DEBUG)
 # Config
 # ---------------------------------------------------------------------------
 EVENTS_FILE = Path(__file__).parent / "events.json"
+# Seconds to coalesce mutations before events.json is rewritten
+FLUSH_DELAY = 1.0
 
 COLUMBIA_FEED_URL = (
     "https://events.columbia.edu/feeder/main/eventsFeed.do"
@@ -55,83 +60,127 @@ COLUMBIA_FEED_URL = (
     "&skinName=list-json&count=50&days=14"
 )
 
+# Shared client — reuses the connection (and TLS session) to the events
+# origin across fetches, over HTTP/2 when offered. Closed in main().
+_EVENTS_CLIENT = httpx.AsyncClient(timeout=30.0, http2=True)
+
 # ---------------------------------------------------------------------------
 # Helpers — event cleaning (mirrors event-cleaner/page.tsx logic)
 # ---------------------------------------------------------------------------
 
+_RE_TAG = re.compile(r"<[^>]*>")
+_RE_DATE_SUFFIX = re.compile(r"/\d{2}$")
+
+
 def _decode_html(text: str) -> str:
-    """Decode common HTML entities."""
-    return (
-        text
-        .replace("&amp;", "&")
-        .replace("&#39;", "'")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&nbsp;", " ")
-    )
+    """Decode HTML entities."""
+    return html.unescape(text)
 
 
 def _strip_html(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    stripped = re.sub(r"<[^>]*>", "", text)
+    stripped = _RE_TAG.sub("", text)
     return _decode_html(stripped).strip()
 
 
-def clean_event(raw: dict) -> dict:
-    """Transform a raw Bedework event into a clean, minimal format."""
-    start = raw.get("start", {})
-    end = raw.get("end", {})
+_EMPTY: dict = {}
 
-    day_name = start.get("dayname", "")[:3]
-    short_date = start.get("shortdate", "")
-    date_part = re.sub(r"/\d{2}$", "", short_date)
-    all_day = start.get("allday") == "true"
 
+def clean_event(raw: dict) -> dict:
+    """Transform a raw Bedework event into a clean, minimal format."""
+    get = raw.get
+    decode, strip = _decode_html, _strip_html
+    # `or _EMPTY` shares one empty dict instead of allocating a default per call
+    start = get("start") or _EMPTY
+    end = get("end") or _EMPTY
+    location = get("location") or _EMPTY
+    start_get = start.get
+
+    day_name = start_get("dayname", "")[:3]
+    date_part = _RE_DATE_SUFFIX.sub("", start_get("shortdate", ""))
+    all_day = start_get("allday") == "true"
     if all_day:
         time_range = "All day"
     else:
-        time_range = f"{start.get('time', '')} - {end.get('time', '')}"
-
-    location = raw.get("location", {})
+        time_range = f"{start_get('time', '')} - {end.get('time', '')}"
 
     return {
-        "id": raw.get("guid", ""),
-        "summary": _decode_html(raw.get("summary", "")),
-        "link": raw.get("link", ""),
-        "eventlink": raw.get("eventlink", ""),
-        "startDate": raw.get("startDate", ""),
-        "endDate": raw.get("endDate", ""),
+        "id": get("guid", ""),
+        "summary": decode(get("summary", "")),
+        "link": get("link", ""),
+        "eventlink": get("eventlink", ""),
+        "startDate": get("startDate", ""),
+        "endDate": get("endDate", ""),
         "location": {
             "address": location.get("address", "").replace("\t", " "),
             "mapLink": location.get("link", ""),
         },
-        "description": _strip_html(raw.get("description", "")),
+        "description": strip(get("description", "")),
         "calendar": {
             "shortLabel": f"{day_name} {date_part}",
             "timeRange": time_range,
-            "timezone": start.get("timezone", "America/New_York"),
+            "timezone": start_get("timezone", "America/New_York"),
             "allDay": all_day,
         },
     }
 
 
+def _read_json(path: Path, default):
+    """Parse a JSON file, returning default if it is missing or unreadable."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
+        return default
+
+
+def _write_json(path: Path, obj) -> None:
+    """Serialize obj to path as indented JSON.
+
+    Writes a sibling temp file and swaps it in with os.replace, so a crash
+    mid-write can't leave a truncated file behind.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp, path)
+
+
 def _read_events_file() -> list[dict]:
     """Read events from the local JSON file. Returns [] if file doesn't exist."""
-    if not EVENTS_FILE.exists():
-        return []
-    try:
-        data = json.loads(EVENTS_FILE.read_text(encoding="utf-8"))
-        return data if isinstance(data, list) else []
-    except (json.JSONDecodeError, IOError):
-        return []
+    data = _read_json(EVENTS_FILE, [])
+    return data if isinstance(data, list) else []
 
 
 def _write_events_file(events: list[dict]) -> None:
     """Write events list to the local JSON file."""
-    EVENTS_FILE.write_text(
-        json.dumps(events, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _write_json(EVENTS_FILE, events)
+
+
+# In-memory event store keyed by id, loaded once at startup. Tools mutate
+# it directly and _mark_dirty() schedules a debounced write of events.json.
+_EVENTS: dict[str, dict] = {e["id"]: e for e in _read_events_file() if "id" in e}
+_flush_handle: asyncio.TimerHandle | None = None
+
+
+def _flush_events() -> None:
+    """Write the in-memory store to events.json."""
+    global _flush_handle
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+    _write_events_file(list(_EVENTS.values()))
+
+
+def _mark_dirty() -> None:
+    """Schedule a flush FLUSH_DELAY seconds out, coalescing repeated calls."""
+    global _flush_handle
+    if _flush_handle is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _flush_events()
+        return
+    _flush_handle = loop.call_later(FLUSH_DELAY, _flush_events)
 
 
 # ---------------------------------------------------------------------------
@@ -139,31 +188,35 @@ def _write_events_file(events: list[dict]) -> None:
 # ---------------------------------------------------------------------------
 
 @tool(description="Fetch upcoming Columbia University events from the Bedework feed, clean them, and save to local JSON. Returns the cleaned events.")
-def fetch_columbia_events() -> list[dict]:
+async def fetch_columbia_events() -> list[dict]:
     """Fetch events from Columbia's feed, clean them, and persist to events.json."""
     logger.info("[TOOL CALL] fetch_columbia_events()")
 
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.get(COLUMBIA_FEED_URL)
+    # Stream the feed through ijson so each event is cleaned as it arrives
+    # rather than materializing the whole payload first
+    cleaned = []
+    raw_events = ijson.sendable_list()
+    parser = ijson.items_coro(raw_events, "bwEventList.events.item")
+    async with _EVENTS_CLIENT.stream("GET", COLUMBIA_FEED_URL) as resp:
         resp.raise_for_status()
-        data = resp.json()
-
-    raw_events = data.get("bwEventList", {}).get("events", [])
-    logger.info(f"  Fetched {len(raw_events)} raw events from Columbia feed")
-
-    cleaned = [clean_event(e) for e in raw_events]
+        async for chunk in resp.aiter_bytes():
+            parser.send(chunk)
+            cleaned.extend(clean_event(e) for e in raw_events)
+            del raw_events[:]
+    parser.close()
 
-    # Merge with existing: keep existing events not in the new fetch, add new ones
-    existing = _read_events_file()
-    existing_ids = {e["id"] for e in existing if "id" in e}
-    new_ids = {e["id"] for e in cleaned}
+    logger.info(f"  Fetched {len(cleaned)} raw events from Columbia feed")
 
     # Keep manually-added events (those not from the feed) + all freshly fetched
-    manual_events = [e for e in existing if e.get("id") not in new_ids and e.get("_source") == "manual"]
-    merged = cleaned + manual_events
-
-    _write_events_file(merged)
-    logger.info(f"  Saved {len(merged)} events to {EVENTS_FILE}")
+    global _EVENTS
+    new_ids = {e["id"] for e in cleaned}
+    manual_events = [
+        e for eid, e in _EVENTS.items()
+        if e.get("_source") == "manual" and eid not in new_ids
+    ]
+    _EVENTS = {e["id"]: e for e in itertools.chain(cleaned, manual_events)}
+    _mark_dirty()
+    logger.info(f"  Saved {len(_EVENTS)} events to {EVENTS_FILE}")
 
     return cleaned
 
@@ -172,7 +225,7 @@ def fetch_columbia_events() -> list[dict]:
 def list_events() -> list[dict]:
     """Read and return all events from the local JSON store."""
     logger.info("[TOOL CALL] list_events()")
-    events = _read_events_file()
+    events = list(_EVENTS.values())
     logger.info(f"  Found {len(events)} events")
     return events
 
@@ -210,10 +263,9 @@ def add_event(
         "_source": "manual",
     }
 
-    events = _read_events_file()
-    events.append(event)
-    _write_events_file(events)
-    logger.info(f"  Added event, total now {len(events)}")
+    _EVENTS[event["id"]] = event
+    _mark_dirty()
+    logger.info(f"  Added event, total now {len(_EVENTS)}")
     return event
 
 
@@ -230,13 +282,7 @@ def update_event(
     """Update fields of an existing event by id."""
     logger.info(f"[TOOL CALL] update_event(id={event_id!r})")
 
-    events = _read_events_file()
-    target = None
-    for e in events:
-        if e.get("id") == event_id:
-            target = e
-            break
-
+    target = _EVENTS.get(event_id)
     if target is None:
         return {"error": f"Event with id '{event_id}' not found"}
 
@@ -253,7 +299,7 @@ def update_event(
     if location_mapLink:
         target["location"]["mapLink"] = location_mapLink
 
-    _write_events_file(events)
+    _mark_dirty()
     logger.info(f"  Updated event {event_id!r}")
     return target
 
@@ -263,16 +309,12 @@ def delete_event(event_id: str) -> dict:
     """Remove an event from the JSON store by id."""
     logger.info(f"[TOOL CALL] delete_event(id={event_id!r})")
 
-    events = _read_events_file()
-    original_count = len(events)
-    events = [e for e in events if e.get("id") != event_id]
-
-    if len(events) == original_count:
+    if _EVENTS.pop(event_id, None) is None:
         return {"error": f"Event with id '{event_id}' not found", "deleted": False}
 
-    _write_events_file(events)
-    logger.info(f"  Deleted event {event_id!r}, {len(events)} remaining")
-    return {"deleted": True, "remaining": len(events)}
+    _mark_dirty()
+    logger.info(f"  Deleted event {event_id!r}, {len(_EVENTS)} remaining")
+    return {"deleted": True, "remaining": len(_EVENTS)}
 
 
 # ---------------------------------------------------------------------------
@@ -290,6 +332,15 @@ server.collect(fetch_columbia_events, list_events, add_event, update_event, dele
 logger.info("Registered tools: fetch_columbia_events, list_events, add_event, update_event, delete_event")
 
 
+async def main(port: int) -> None:
+    try:
+        await server.serve(port=port)
+    finally:
+        if _flush_handle is not None:
+            _flush_events()
+        await _EVENTS_CLIENT.aclose()
+
+
 if __name__ == "__main__":
     port = int(os.getenv("MCP_PORT", "8001"))
     logger.info("=" * 60)
@@ -299,4 +350,4 @@ if __name__ == "__main__":
     logger.info(f"  Tools: fetch_columbia_events, list_events, add_event, update_event, delete_event")
     logger.info(f"  PID: {os.getpid()}")
     logger.info("=" * 60)
-    asyncio.run(server.serve(port=port))
+    asyncio.run(main(port))
@@ -16,15 +16,20 @@ The server starts at http://127.0.0.1:8003/mcp (Streamable HTTP).
 import os
 import re
 import sys
-import json
+import time
+import hashlib
 import logging
+import threading
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from dedalus_mcp import MCPServer, tool
 from dedalus_mcp.server import TransportSecuritySettings
 from dotenv import load_dotenv
@@ -55,6 +60,54 @@ CACHE_FILE = SERVER_DIR / "findings_cache.json"
 HTTP_TIMEOUT = 30.0
 MAX_CONTENT_LENGTH = 500_000  # 500KB max per page
 USER_AGENT = "SchoolAssistant/1.0 (educational crawler)"
+# BeautifulSoup tree builder for the fallback parse path; lxml is C-backed
+# and several times faster than the pure-Python "html.parser"
+PARSER = "lxml"
+# Max page fetches in flight overall, and against any single host
+MAX_CONCURRENCY = int(os.getenv("EXT_SOURCES_MAX_CONCURRENCY", "16"))
+MAX_PER_HOST = int(os.getenv("EXT_SOURCES_MAX_PER_HOST", "4"))
+# Max requests per second started against any single host
+HOST_RATE = float(os.getenv("EXT_SOURCES_HOST_RATE", "5"))
+# Seconds a fetched page is reused before it is downloaded again
+PAGE_TTL = float(os.getenv("EXT_SOURCES_PAGE_TTL", "600"))
+# Seconds to coalesce cache updates before findings_cache.json is rewritten
+FLUSH_DELAY = 2.0
+
+
+# Shared client — keeps connections to course sites alive across pages and
+# tool calls instead of a fresh TCP/TLS handshake per fetch, and multiplexes
+# same-host sub-pages over HTTP/2 where offered. Closed in main().
+_CLIENT = httpx.AsyncClient(
+    headers={"User-Agent": USER_AGENT},
+    follow_redirects=True,
+    timeout=HTTP_TIMEOUT,
+    http2=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+)
+
+# Caps on concurrent fetches so fan-out neither trips course sites' rate
+# limits nor runs the process out of sockets
+_FETCH_SEM = asyncio.BoundedSemaphore(MAX_CONCURRENCY)
+# Per-host concurrency cap plus a token bucket pacing request starts, so a
+# burst of sub-pages on one site doesn't earn 429s or dropped connections
+_HOST_LIMITS: dict[str, tuple[asyncio.BoundedSemaphore, AsyncLimiter]] = {}
+
+
+def _host_limits(url: str) -> tuple[asyncio.BoundedSemaphore, AsyncLimiter]:
+    host = urlsplit(url).netloc
+    limits = _HOST_LIMITS.get(host)
+    if limits is None:
+        limits = _HOST_LIMITS[host] = (
+            asyncio.BoundedSemaphore(MAX_PER_HOST),
+            AsyncLimiter(max_rate=HOST_RATE, time_period=1.0),
+        )
+    return limits
+
+
+# Recently fetched pages by requested URL -> (expires_at, html, final_url),
+# so the list/crawl/fetch round trips of one session don't re-download
+_PAGE_CACHE: dict[str, tuple[float, str, str]] = {}
+_PAGE_CACHE_MAX = 256
 
 
 # ---------------------------------------------------------------------------
@@ -66,17 +119,14 @@ def _read_links() -> list[dict]:
     if not LINKS_FILE.exists():
         return []
     try:
-        return json.loads(LINKS_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
+        return orjson.loads(LINKS_FILE.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
         return []
 
 
 def _write_links(links: list[dict]) -> None:
     """Write source links to LINKS.json."""
-    LINKS_FILE.write_text(
-        json.dumps(links, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    LINKS_FILE.write_bytes(orjson.dumps(links, option=orjson.OPT_INDENT_2))
 
 
 def _read_cache() -> dict:
@@ -84,23 +134,74 @@ def _read_cache() -> dict:
     if not CACHE_FILE.exists():
         return {"findings": [], "crawlLog": [], "lastUpdated": None}
     try:
-        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
+        return orjson.loads(CACHE_FILE.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
         return {"findings": [], "crawlLog": [], "lastUpdated": None}
 
 
+# In-memory findings cache, loaded once at startup. _update_cache mutates it
+# and _mark_dirty() schedules a single debounced rewrite of CACHE_FILE.
+_CACHE: dict = _read_cache()
+_flush_handle: asyncio.TimerHandle | None = None
+
+# Findings indexed by id for O(1) upserts; written back to CACHE_FILE as the
+# "findings" list the app reads
+_FINDINGS: dict[str, dict] = {
+    f.get("id"): f for f in _CACHE.pop("findings", None) or [] if isinstance(f, dict)
+}
+
+
+def _encode_finding(finding: dict) -> bytes:
+    """Encode one finding as compact JSON for CACHE_FILE."""
+    return orjson.dumps(finding, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Each finding pre-encoded at insert time, in the same order as _FINDINGS,
+# so a flush only re-encodes the small crawlLog/lastUpdated part
+_FINDINGS_JSON: dict[str, bytes] = {fid: _encode_finding(f) for fid, f in _FINDINGS.items()}
+
+
+def _flush_cache() -> None:
+    """Write the in-memory findings cache to CACHE_FILE."""
+    global _flush_handle
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+    rest = orjson.dumps(_CACHE, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # One finding per line, then the remaining keys spliced in from `rest`
+    findings = b",\n    ".join(_FINDINGS_JSON.values())
+    head = b'{\n  "findings": [\n    ' + findings + b"\n  ]" if findings else b'{\n  "findings": []'
+    CACHE_FILE.write_bytes(head + (b",\n" + rest[2:] if _CACHE else b"\n}"))
+
+
+def _mark_dirty() -> None:
+    """Schedule a flush FLUSH_DELAY seconds out, coalescing repeated calls."""
+    global _flush_handle
+    if _flush_handle is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _flush_cache()
+        return
+    _flush_handle = loop.call_later(FLUSH_DELAY, _flush_cache)
+
+
 def _update_cache(key: str, data: any) -> None:
-    """Update a key in the findings cache file."""
-    cache = _read_cache()
-    cache[key] = data
-    cache["lastUpdated"] = datetime.now().isoformat()
-    CACHE_FILE.write_text(
-        json.dumps(cache, indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
-    )
+    """Update a key in the findings cache and schedule a write to disk."""
+    _CACHE[key] = data
+    _CACHE["lastUpdated"] = datetime.now().isoformat()
+    _mark_dirty()
     logger.info(f"  Cache updated: {key} ({len(data) if isinstance(data, list) else 'obj'} items)")
 
 
+def _findings_changed() -> None:
+    """Record a change to _FINDINGS and schedule a write to disk."""
+    _CACHE["lastUpdated"] = datetime.now().isoformat()
+    _mark_dirty()
+    logger.info(f"  Cache updated: findings ({len(_FINDINGS)} items)")
+
+
 def _coerce_str(val: any) -> str:
     """Coerce a value to str — handles the case where the MCP bridge passes
     a dict like {"url": "..."} instead of a plain string."""
@@ -133,97 +234,207 @@ def _coerce_list(val: any) -> list:
     """Coerce a value to list — handles JSON string from MCP bridge."""
     if isinstance(val, str):
         try:
-            parsed = json.loads(val)
+            parsed = orjson.loads(val)
             if isinstance(parsed, list):
                 return parsed
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             pass
     if isinstance(val, list):
         return val
     return []
 
 
-def _fetch_page(url: str) -> tuple[str, str]:
+# Stand-in body _fetch_page returns for PDFs and other non-HTML responses
+_NON_HTML = "(Non-HTML content: "
+
+
+async def _fetch_page(url: str) -> tuple[str, str]:
     """Fetch a web page and return (html_content, final_url).
 
-    Follows redirects. Respects MAX_CONTENT_LENGTH.
+    Follows redirects. Respects MAX_CONTENT_LENGTH: the body is streamed
+    and reading stops once that many bytes have arrived, and non-HTML
+    bodies are never downloaded at all.
     """
     url = _coerce_str(url)
+    cached = _PAGE_CACHE.get(url)
+    if cached and cached[0] > time.monotonic():
+        logger.debug(f"  Cached: {url}")
+        return cached[1], cached[2]
+
     logger.debug(f"  Fetching: {url}")
-    response = httpx.get(
-        url,
-        headers={"User-Agent": USER_AGENT},
-        follow_redirects=True,
-        timeout=HTTP_TIMEOUT,
-    )
-    response.raise_for_status()
+    host_sem, host_limiter = _host_limits(url)
+    # Global slot last, so requests queued behind a busy host don't hold
+    # it and starve the other hosts
+    async with host_sem, host_limiter, _FETCH_SEM:
+        async with _CLIENT.stream("GET", url) as response:
+            response.raise_for_status()
 
-    content_type = response.headers.get("content-type", "")
-    if "text/html" not in content_type and "text/plain" not in content_type:
-        return f"(Non-HTML content: {content_type})", str(response.url)
+            content_type = response.headers.get("content-type", "")
+            if "text/html" not in content_type and "text/plain" not in content_type:
+                return _remember_page(url, f"{_NON_HTML}{content_type})", str(response.url))
 
-    text = response.text[:MAX_CONTENT_LENGTH]
-    return text, str(response.url)
+            body = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=32_768):
+                body += chunk
+                if len(body) >= MAX_CONTENT_LENGTH:
+                    break
 
+    text = body[:MAX_CONTENT_LENGTH].decode(response.encoding or "utf-8", errors="replace")
+    return _remember_page(url, text, str(response.url))
 
-def _extract_text(html: str) -> str:
-    """Extract readable text from HTML using BeautifulSoup."""
-    soup = BeautifulSoup(html, "html.parser")
 
-    # Remove script and style elements
-    for element in soup(["script", "style", "nav", "footer", "header"]):
-        element.decompose()
+def _remember_page(url: str, html: str, final_url: str) -> tuple[str, str]:
+    """Store a fetched page in _PAGE_CACHE and return (html, final_url)."""
+    if len(_PAGE_CACHE) >= _PAGE_CACHE_MAX:
+        _PAGE_CACHE.pop(next(iter(_PAGE_CACHE)))
+    _PAGE_CACHE[url] = (time.monotonic() + PAGE_TTL, html, final_url)
+    return html, final_url
+
+
+_CHROME_TAGS = ["script", "style", "nav", "footer", "header"]
+
+# hrefs that never point at a crawlable page
+_SKIP_PREFIXES = ("#", "javascript:", "mailto:", "tel:", "data:", "blob:")
+
+
+def _collect_link(links: list[dict], seen: set, base_url: str, href: str, link_text: str) -> None:
+    """Resolve href against base_url and append it unless skipped or already seen."""
+    href = href.strip()
+    if not href or href.startswith(_SKIP_PREFIXES):
+        return
+
+    absolute_url = urljoin(base_url, href)
+    if absolute_url in seen:
+        return
+    seen.add(absolute_url)
+
+    links.append({
+        "url": absolute_url,
+        "text": link_text[:200],
+    })
+
+
+# _parse_page results by (body digest, base_url, with_links), so repeat
+# parses of the same page are free. Keyed on a digest rather than the body
+# so cached entries don't pin whole pages in memory. Callers run the parse
+# via asyncio.to_thread so it doesn't stall the event loop, hence the lock.
+_PARSE_CACHE: dict[tuple[bytes, str, bool], tuple[str, list[dict]]] = {}
+_PARSE_CACHE_MAX = 512
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _parse_page(html: str, base_url: str, with_links: bool = True) -> tuple[str, list[dict]]:
+    """Parse HTML once and return (readable_text, links).
+
+    Links are collected first (nav/header links included), then script,
+    style, and page chrome are dropped from the same tree to get the text.
+    Callers that only need the text pass with_links=False to skip walking
+    and resolving every anchor. Results are cached in _PARSE_CACHE.
+    """
+    key = (_content_digest(html), base_url, with_links)
+    parsed = _PARSE_CACHE.get(key)
+    if parsed is None:
+        parsed = _parse_html(html, base_url, with_links)
+        with _PARSE_CACHE_LOCK:
+            if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+                _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+            _PARSE_CACHE[key] = parsed
+    return parsed
+
+
+def _parse_html(html: str, base_url: str, with_links: bool) -> tuple[str, list[dict]]:
+    """Uncached parse behind _parse_page.
+
+    Uses selectolax, falling back to BeautifulSoup if it can't parse the page.
+    """
+    try:
+        tree = LexborHTMLParser(html)
+        links = []
+        seen = set()
+        for a in tree.css("a[href]") if with_links else ():
+            _collect_link(links, seen, base_url, a.attributes.get("href") or "", a.text(strip=True))
+
+        tree.strip_tags(_CHROME_TAGS)
+        # Join on a sentinel so empty text nodes can be dropped, matching
+        # BeautifulSoup's get_text(separator="\n", strip=True)
+        raw = tree.root.text(separator="\x00", strip=True) if tree.root else ""
+        text = "\n".join(part for part in raw.split("\x00") if part)
+    except Exception as e:
+        logger.debug(f"  selectolax failed on {base_url} ({e}), falling back to BeautifulSoup")
+        text, links = _parse_page_bs4(html, base_url, with_links)
 
-    text = soup.get_text(separator="\n", strip=True)
     # Collapse excessive blank lines
     text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+    return text.strip(), links
 
 
-def _extract_links(html: str, base_url: str) -> list[dict]:
-    """Extract all links from an HTML page, resolving relative URLs."""
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_page_bs4(html: str, base_url: str, with_links: bool) -> tuple[str, list[dict]]:
+    """BeautifulSoup version of _parse_html's parse, before blank-line cleanup."""
+    soup = BeautifulSoup(html, PARSER)
+
     links = []
     seen = set()
+    for a in soup.find_all("a", href=True) if with_links else ():
+        _collect_link(links, seen, base_url, a["href"], a.get_text(strip=True))
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if not href or href.startswith("#") or href.startswith("javascript:") or href.startswith("mailto:"):
-            continue
+    # Remove script and style elements
+    for element in soup(_CHROME_TAGS):
+        element.decompose()
 
-        absolute_url = urljoin(base_url, href)
-        if absolute_url in seen:
-            continue
-        seen.add(absolute_url)
+    return soup.get_text(separator="\n", strip=True), links
 
-        link_text = a.get_text(strip=True)[:200]
-        links.append({
-            "url": absolute_url,
-            "text": link_text,
-        })
 
-    return links
+def _content_digest(html: str) -> bytes:
+    """Digest of a page body, for spotting one page served under several URLs."""
+    return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
 
 
-def _is_same_site(url1: str, url2: str) -> bool:
-    """Check if two URLs are on the same site (same netloc)."""
-    return urlparse(url1).netloc == urlparse(url2).netloc
+def _seen_body(html: str, seen_bodies: set[bytes]) -> bool:
+    """Record html's digest in seen_bodies; True if it was already there.
+
+    Non-HTML stand-ins are never counted: every PDF of a given type comes
+    back as the same string.
+    """
+    if html.startswith(_NON_HTML):
+        return False
+    digest = _content_digest(html)
+    if digest in seen_bodies:
+        return True
+    seen_bodies.add(digest)
+    return False
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of url for dedupe: lowercase scheme and host, no
+    fragment, utm_* tracking params dropped, remaining params sorted."""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_")
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+
+# Extensions of large binary files not worth following
+_SKIP_EXTS = frozenset({"zip", "tar", "gz", "mp4", "mov", "avi", "mp3", "wav", "iso", "dmg", "exe"})
+
+_KEYWORDS = [
+    "syllabus", "homework", "assignment", "hw", "problem set", "pset",
+    "exam", "midterm", "final", "quiz", "test",
+    "office hour", "oh", "schedule", "calendar",
+    "grade", "grading", "policy", "policies",
+    "lecture", "slide", "note", "reading",
+    "lab", "project", "recitation", "section",
+    "ta", "staff", "instructor", "professor",
+    ".pdf", ".docx", ".doc",
+]
+# One alternation over all keywords, so each string is scanned once in C
+_INTERESTING_RE = re.compile("|".join(re.escape(kw) for kw in _KEYWORDS), re.IGNORECASE)
 
 
 def _looks_interesting(url: str, link_text: str) -> bool:
     """Heuristic: does this link look like it could contain academic info?"""
-    combined = (url + " " + link_text).lower()
-    keywords = [
-        "syllabus", "homework", "assignment", "hw", "problem set", "pset",
-        "exam", "midterm", "final", "quiz", "test",
-        "office hour", "oh", "schedule", "calendar",
-        "grade", "grading", "policy", "policies",
-        "lecture", "slide", "note", "reading",
-        "lab", "project", "recitation", "section",
-        "ta", "staff", "instructor", "professor",
-        ".pdf", ".docx", ".doc",
-    ]
-    return any(kw in combined for kw in keywords)
+    return _INTERESTING_RE.search(url) is not None or _INTERESTING_RE.search(link_text) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -252,10 +463,11 @@ def add_source(url: str, label: str = "") -> list[dict]:
         logger.info("  Source already exists, skipping")
         return links
 
+    parts = urlsplit(url)
     new_link = {
-        "id": urlparse(url).netloc.replace(".", "-") + "-" + str(len(links)),
+        "id": parts.netloc.replace(".", "-") + "-" + str(len(links)),
         "url": url,
-        "label": label or urlparse(url).path.strip("/") or urlparse(url).netloc,
+        "label": label or parts.path.strip("/") or parts.netloc,
         "addedAt": datetime.now().isoformat(),
     }
     links.append(new_link)
@@ -276,21 +488,21 @@ def remove_source(source_id: str = "", url: str = "") -> list[dict]:
     links = [l for l in links if l.get("id") != source_id and l.get("url") != url]
 
     _write_links(links)
+    _PAGE_CACHE.clear()
     removed = original_count - len(links)
     logger.info(f"  Removed {removed} source(s), {len(links)} remaining")
     return links
 
 
 @tool(description="Fetch a specific web page URL and return its plain text content along with all links found on the page. Use this to explore any URL — course homepage, syllabus page, etc.")
-def fetch_page(url: str) -> dict:
+async def fetch_page(url: str) -> dict:
     """Fetch a single page and return its text content and links."""
     url = _coerce_str(url)
     logger.info(f"[TOOL CALL] fetch_page(url={url!r})")
 
     try:
-        html, final_url = _fetch_page(url)
-        text = _extract_text(html)
-        links = _extract_links(html, final_url)
+        html, final_url = await _fetch_page(url)
+        text, links = await asyncio.to_thread(_parse_page, html, final_url)
 
         # Truncate text for LLM consumption
         if len(text) > 15000:
@@ -311,12 +523,21 @@ def fetch_page(url: str) -> dict:
 
 
 @tool(description="Crawl a source URL: fetch the homepage, find interesting sub-links (assignments, syllabus, exams, office hours), and follow them. Returns a structured summary of everything found. This is the main tool for discovering academic info from a course homepage.")
-def crawl_source(url: str, max_subpages: int = 10) -> dict:
+async def crawl_source(url: str, max_subpages: int = 10) -> dict:
     """Crawl a source homepage and its interesting sub-links."""
     url = _coerce_str(url)
     max_subpages = _coerce_int(max_subpages, 10)
     logger.info(f"[TOOL CALL] crawl_source(url={url!r}, max_subpages={max_subpages})")
+    return await _crawl(url, max_subpages, set(), set())
+
 
+async def _crawl(url: str, max_subpages: int, seen: set[str], seen_bodies: set[bytes]) -> dict:
+    """Crawl url and its interesting sub-links.
+
+    Skips any page whose normalized URL is in seen, and any sub-page whose
+    body digest is in seen_bodies (e.g. index vs. index.html), adding the
+    ones it visits to both.
+    """
     results = {
         "source_url": url,
         "pages_crawled": [],
@@ -326,9 +547,11 @@ def crawl_source(url: str, max_subpages: int = 10) -> dict:
 
     # Fetch the main page
     try:
-        html, final_url = _fetch_page(url)
-        main_text = _extract_text(html)
-        all_links = _extract_links(html, final_url)
+        html, final_url = await _fetch_page(url)
+        main_text, all_links = await asyncio.to_thread(_parse_page, html, final_url)
+        seen.add(_normalize_url(url))
+        seen.add(_normalize_url(final_url))
+        _seen_body(html, seen_bodies)
 
         results["pages_crawled"].append({
             "url": final_url,
@@ -338,44 +561,67 @@ def crawl_source(url: str, max_subpages: int = 10) -> dict:
         })
 
         # Find interesting links to follow
+        site = urlsplit(url).netloc
         interesting = []
         for link in all_links:
             if _looks_interesting(link["url"], link["text"]):
                 interesting.append(link)
-            elif _is_same_site(url, link["url"]):
+            elif urlsplit(link["url"]).netloc == site:
                 # Same-site links might still be useful
                 interesting.append(link)
 
         results["interesting_links_found"] = interesting[:30]
 
         # Follow the most promising links
-        followed = 0
+        candidates = []
         for link in interesting:
-            if followed >= max_subpages:
-                break
             sub_url = link["url"]
 
             # Skip non-HTTP links, anchors, large files
-            parsed = urlparse(sub_url)
-            if parsed.scheme not in ("http", "https"):
+            parts = urlsplit(sub_url)
+            if parts.scheme not in ("http", "https"):
+                continue
+            if parts.path.rpartition(".")[2].lower() in _SKIP_EXTS:
                 continue
-            ext = parsed.path.lower().split(".")[-1] if "." in parsed.path else ""
-            if ext in ("zip", "tar", "gz", "mp4", "mov", "avi", "mp3", "wav"):
+            # Already crawled for another source in this crawl_all_sources run
+            if _normalize_url(sub_url) in seen:
                 continue
+            candidates.append(link)
 
+        async def follow(link: dict) -> dict | None:
+            sub_url = link["url"]
+            # Claimed only once the fetch starts, so links cut off by
+            # max_subpages stay open to the other sources
+            norm_url = _normalize_url(sub_url)
+            if norm_url in seen:
+                return None
+            seen.add(norm_url)
             try:
-                sub_html, sub_final_url = _fetch_page(sub_url)
-                sub_text = _extract_text(sub_html)
-
-                results["pages_crawled"].append({
-                    "url": sub_final_url,
-                    "title": link["text"][:100] or sub_final_url,
-                    "text_preview": sub_text[:2000],
-                })
-                followed += 1
+                sub_html, sub_final_url = await _fetch_page(sub_url)
             except Exception as e:
                 results["errors"].append({"url": sub_url, "error": str(e)})
                 logger.debug(f"  Failed to follow link {sub_url}: {e}")
+                return None
+            if _seen_body(sub_html, seen_bodies):
+                logger.debug(f"  Skipping {sub_final_url}: same content as a page already crawled")
+                return None
+            sub_text, _ = await asyncio.to_thread(_parse_page, sub_html, sub_final_url, with_links=False)
+            return {
+                "url": sub_final_url,
+                "title": link["text"][:100] or sub_final_url,
+                "text_preview": sub_text[:2000],
+            }
+
+        # Fetch sub-pages concurrently, a batch of however many are still
+        # needed at a time, so failed or duplicate links are backfilled
+        # from the rest
+        followed = 0
+        while candidates and followed < max_subpages:
+            batch, candidates = candidates[:max_subpages - followed], candidates[max_subpages - followed:]
+            for page in await asyncio.gather(*(follow(link) for link in batch)):
+                if page is not None:
+                    results["pages_crawled"].append(page)
+                    followed += 1
 
     except Exception as e:
         results["errors"].append({"url": url, "error": str(e)})
@@ -389,18 +635,22 @@ def crawl_source(url: str, max_subpages: int = 10) -> dict:
 
 
 @tool(description="Crawl ALL sources in LINKS.json and return combined results. Use this for a comprehensive scan of all course sources.")
-def crawl_all_sources(max_subpages_per_source: int = 5) -> dict:
+async def crawl_all_sources(max_subpages_per_source: int = 5) -> dict:
     """Crawl all configured sources."""
     max_subpages_per_source = _coerce_int(max_subpages_per_source, 5)
     logger.info(f"[TOOL CALL] crawl_all_sources(max_subpages={max_subpages_per_source})")
     links = _read_links()
 
-    all_results = []
-    for link in links:
-        result = crawl_source(link["url"], max_subpages=max_subpages_per_source)
+    # Shared across sources so a page linked from several courses is fetched
+    # once. Sources are crawled concurrently; the fetch semaphores bound load.
+    seen: set[str] = set()
+    seen_bodies: set[bytes] = set()
+    all_results = await asyncio.gather(*(
+        _crawl(_coerce_str(link["url"]), max_subpages_per_source, seen, seen_bodies) for link in links
+    ))
+    for link, result in zip(links, all_results):
         result["source_label"] = link.get("label", "")
         result["source_id"] = link.get("id", "")
-        all_results.append(result)
 
     # Update crawl log
     _update_cache("crawlLog", [{
@@ -424,8 +674,8 @@ def save_findings(findings: str) -> dict:
     # Coerce findings from JSON string to list[dict]
     if isinstance(findings, str):
         try:
-            findings = json.loads(findings)
-        except (json.JSONDecodeError, ValueError):
+            findings = orjson.loads(findings)
+        except ValueError:
             logger.error(f"  Failed to parse findings JSON: {findings[:200]}")
             return {"error": "findings must be a JSON array of objects", "saved": 0}
 
@@ -434,29 +684,29 @@ def save_findings(findings: str) -> dict:
 
     logger.info(f"[TOOL CALL] save_findings({len(findings)} findings)")
 
-    cache = _read_cache()
-    existing = cache.get("findings", [])
-
     # Add metadata to each finding
     for i, f in enumerate(findings):
         if not isinstance(f, dict):
             continue
         f["savedAt"] = datetime.now().isoformat()
         if "id" not in f:
-            f["id"] = f"{f.get('type', 'unknown')}-{len(existing) + i}-{datetime.now().strftime('%H%M%S')}"
+            f["id"] = f"{f.get('type', 'unknown')}-{len(_FINDINGS) + i}-{datetime.now().strftime('%H%M%S')}"
 
     # Filter to only valid dicts
     findings = [f for f in findings if isinstance(f, dict)]
 
-    # Merge: replace findings with same id, add new ones
-    new_ids = {nf.get("id") for nf in findings}
-    merged = [f for f in existing if f.get("id") not in new_ids]
-    merged.extend(findings)
+    # Merge: replace findings with same id, add new ones (replacements
+    # move to the end, as new findings do)
+    for f in findings:
+        _FINDINGS.pop(f["id"], None)
+        _FINDINGS[f["id"]] = f
+        _FINDINGS_JSON.pop(f["id"], None)
+        _FINDINGS_JSON[f["id"]] = _encode_finding(f)
 
-    _update_cache("findings", merged)
+    _findings_changed()
 
-    logger.info(f"  Saved {len(findings)} new findings, {len(merged)} total")
-    return {"saved": len(findings), "total": len(merged)}
+    logger.info(f"  Saved {len(findings)} new findings, {len(_FINDINGS)} total")
+    return {"saved": len(findings), "total": len(_FINDINGS)}
 
 
 @tool(description="List all saved findings from the cache. Optionally filter by type (homework, exam, office_hours, syllabus, lecture, other).")
@@ -465,13 +715,11 @@ def list_findings(finding_type: str = "") -> list[dict]:
     finding_type = _coerce_str(finding_type) if finding_type else ""
     logger.info(f"[TOOL CALL] list_findings(type={finding_type!r})")
 
-    cache = _read_cache()
-    findings = cache.get("findings", [])
-
     if finding_type:
-        findings = [f for f in findings if f.get("type") == finding_type]
+        findings = [f for f in _FINDINGS.values() if f.get("type") == finding_type]
+    else:
+        findings = list(_FINDINGS.values())
 
-    _update_cache("findings", cache.get("findings", []))  # refresh lastUpdated
     logger.info(f"  Returning {len(findings)} findings")
     return findings
 
@@ -480,10 +728,20 @@ def list_findings(finding_type: str = "") -> list[dict]:
 def clear_findings() -> dict:
     """Clear all findings from cache."""
     logger.info("[TOOL CALL] clear_findings()")
-    _update_cache("findings", [])
+    _FINDINGS.clear()
+    _FINDINGS_JSON.clear()
+    _findings_changed()
     return {"cleared": True}
 
 
+@tool(description="Write the findings cache to findings_cache.json now. Updates are otherwise saved a couple of seconds after they happen.")
+def flush_cache() -> dict:
+    """Persist pending cache updates immediately."""
+    logger.info("[TOOL CALL] flush_cache()")
+    _flush_cache()
+    return {"flushed": True}
+
+
 # ---------------------------------------------------------------------------
 # Server setup
 # ---------------------------------------------------------------------------
@@ -505,8 +763,18 @@ server.collect(
     save_findings,
     list_findings,
     clear_findings,
+    flush_cache,
 )
-logger.info("Registered 9 external-sources tools")
+logger.info("Registered 10 external-sources tools")
+
+
+async def main(port: int) -> None:
+    try:
+        await server.serve(port=port)
+    finally:
+        if _flush_handle is not None:
+            _flush_cache()
+        await _CLIENT.aclose()
 
 
 if __name__ == "__main__":
@@ -518,4 +786,4 @@ if __name__ == "__main__":
     logger.info(f"  Cache file: {CACHE_FILE}")
     logger.info(f"  PID: {os.getpid()}")
     logger.info("=" * 60)
-    asyncio.run(server.serve(port=port))
+    asyncio.run(main(port))